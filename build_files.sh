@@ -1,3 +1,3 @@
 #!/bin/bash
 python3 -m pip install -r requirements.txt --break-system-packages
-python3 manage.py collectstatic --noinput --clear
+ADMIN_ENABLED=True python3 manage.py collectstatic --noinput --clear
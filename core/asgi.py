@@ -12,5 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+# Sync views run on a thread pool under ASGI, so persistent connections are
+# never closed by the request cycle. Use DB_SERVER_SIDE_POOLING instead.
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
@@ -0,0 +1,119 @@
+"""
+Database routing for the optional read replica.
+
+When ``DATABASE_REPLICA_URL`` is set, ``settings.DATABASES`` gains a
+``replica`` alias. Reads are only sent there from inside views wrapped with
+``read_from_replica``; everything else (auth, sessions, writes) stays on the
+primary. As soon as a wrapped view writes, the rest of that request is pinned
+to the primary so it never reads back stale rows from a lagging replica.
+
+Writes usually happen in a POST that redirects to a replica view, so
+``ReadYourWritesMiddleware`` also sets a cookie after any request that wrote,
+and clients holding it read from the primary for ``REPLICA_LAG_SECONDS``.
+"""
+
+import contextvars
+from functools import wraps
+
+from django.conf import settings
+
+PRIMARY_DB_ALIAS = 'default'
+REPLICA_DB_ALIAS = 'replica'
+RECENT_WRITE_COOKIE = 'recent_write'
+
+# Per-request routing state, set by ReadYourWritesMiddleware (or by
+# read_from_replica when the middleware is not installed). A ContextVar
+# (rather than a thread local) keeps this correct under ASGI too.
+_routing_state = contextvars.ContextVar('replica_routing_state', default=None)
+
+
+class _RoutingState:
+    def __init__(self):
+        self.use_replica = False
+        self.wrote = False
+
+
+def replica_configured():
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def pin_to_primary():
+    """Send every remaining read of the current request to the primary."""
+    state = _routing_state.get()
+    if state is not None:
+        state.use_replica = False
+
+
+def read_from_replica(view_func):
+    """
+    Allow safe (GET/HEAD) requests to ``view_func`` to read from the replica,
+    unless the client wrote within the last ``REPLICA_LAG_SECONDS``.
+    """
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return view_func(request, *args, **kwargs)
+        state = _routing_state.get()
+        token = None
+        if state is None:
+            state = _RoutingState()
+            token = _routing_state.set(state)
+        state.use_replica = not state.wrote and RECENT_WRITE_COOKIE not in request.COOKIES
+        try:
+            return view_func(request, *args, **kwargs)
+        finally:
+            state.use_replica = False
+            if token is not None:
+                _routing_state.reset(token)
+    return _wrapped_view
+
+
+class ReadYourWritesMiddleware:
+    """
+    Mark clients that just wrote, so the GET they are redirected to reads
+    their own changes instead of a lagging replica.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = _RoutingState()
+        token = _routing_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+        if state.wrote and replica_configured():
+            response.set_cookie(
+                RECENT_WRITE_COOKIE,
+                '1',
+                max_age=settings.REPLICA_LAG_SECONDS,
+                secure=request.is_secure(),
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _routing_state.get()
+        if state is None or not state.use_replica or not replica_configured():
+            return PRIMARY_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _routing_state.get()
+        if state is not None:
+            state.wrote = True
+        pin_to_primary()
+        return PRIMARY_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data, so objects may relate across them.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica is kept in sync by Postgres, never migrated directly.
+        return db != REPLICA_DB_ALIAS
@@ -12,12 +12,22 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 
 import os
 from pathlib import Path
-import dj_database_url
-from dotenv import load_dotenv
+
+from django.core.exceptions import ImproperlyConfigured
 
 # Load environment variables from .env file
+from dotenv import load_dotenv
 load_dotenv()
 
+# Lean startup (for serverless cold starts) leaves django.contrib.admin out
+# of this process, which is most of what an instance loads and does not need.
+# See core/wsgi_admin.py for how /admin/ is served in lean deployments. The
+# other contrib apps are all used by the tracker pages, and the staticfiles
+# manifest is only read on the first {% static %} lookup either way.
+LEAN_STARTUP = os.environ.get('LEAN_STARTUP', 'False') == 'True'
+
+ADMIN_ENABLED = os.environ.get('ADMIN_ENABLED', str(not LEAN_STARTUP)) == 'True'
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -26,7 +36,10 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # See https://docs.djangoproject.com/en/6.0/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-yl_z%%hd7ja%lqr-v$st$s2=$gbw7j5hjyb+ad124njdozc)&e'
+SECRET_KEY = os.environ.get(
+    'SECRET_KEY',
+    'django-insecure-yl_z%%hd7ja%lqr-v$st$s2=$gbw7j5hjyb+ad124njdozc)&e',
+)
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = os.environ.get('DEBUG', 'True') == 'True'
@@ -37,7 +50,6 @@ ALLOWED_HOSTS = ['*'] # Required for Vercel, or set to your specific .vercel.app
 # Application definition
 
 INSTALLED_APPS = [
-    'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -46,10 +58,15 @@ INSTALLED_APPS = [
     'tracker',
 ]
 
+if ADMIN_ENABLED:
+    INSTALLED_APPS.insert(0, 'django.contrib.admin')
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    # Inside SessionMiddleware, so session saves do not count as writes.
+    'core.db_routers.ReadYourWritesMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -87,10 +104,101 @@ DATABASES = {
     }
 }
 
+# Seconds a worker keeps its database connection open between requests
+# (0 reconnects on every request). core/asgi.py defaults this to 0, because
+# persistent connections leak across the thread pool under ASGI.
+DB_CONN_MAX_AGE = int(os.environ.get("DB_CONN_MAX_AGE", "60"))
+# Check a reused connection is still alive before handing it to a request.
+DB_CONN_HEALTH_CHECKS = os.environ.get("DB_CONN_HEALTH_CHECKS", "True") == "True"
+# Set when DATABASE_URL points at a transaction-mode pooler such as PgBouncer
+# or Supabase's pooler on port 6543. Server-side cursors cannot survive a
+# pooler handing each transaction to a different backend connection.
+DB_SERVER_SIDE_POOLING = os.environ.get("DB_SERVER_SIDE_POOLING", "False") == "True"
+
+
+def parse_database_url(url):
+    import dj_database_url
+
+    return dj_database_url.parse(
+        url,
+        conn_max_age=DB_CONN_MAX_AGE,
+        conn_health_checks=DB_CONN_HEALTH_CHECKS,
+        disable_server_side_cursors=DB_SERVER_SIDE_POOLING,
+    )
+
+
 # Override with Supabase PostgreSQL connection string if DATABASE_URL is present
 database_url = os.environ.get("DATABASE_URL")
 if database_url:
-    DATABASES['default'] = dj_database_url.parse(database_url)
+    DATABASES['default'] = parse_database_url(database_url)
+
+# Optional read replica used by dashboard/report views (see core/db_routers.py).
+# Any URL dj_database_url understands works, e.g. sqlite:///replica.sqlite3 locally.
+replica_url = os.environ.get("DATABASE_REPLICA_URL")
+if replica_url:
+    DATABASES['replica'] = parse_database_url(replica_url)
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+# How long a client that wrote keeps reading from the primary, to cover
+# replication lag across a POST/redirect/GET.
+REPLICA_LAG_SECONDS = int(os.environ.get("REPLICA_LAG_SECONDS", "5"))
+
+DATABASE_ROUTERS = ['core.db_routers.PrimaryReplicaRouter']
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+# Without REDIS_URL each worker gets its own in-memory cache. RedisCache needs
+# the optional `redis` package.
+redis_url = os.environ.get("REDIS_URL")
+if redis_url:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': redis_url,
+        }
+    }
+
+
+# Sessions
+# https://docs.djangoproject.com/en/6.0/topics/http/sessions/
+
+# "db" reads django_session on every authenticated request. "signed_cookies"
+# keeps the session in the browser, "cache" in CACHES only, and "cached_db"
+# reads through the cache but still writes to the database.
+SESSION_STORE = os.environ.get("SESSION_STORE", "db")
+session_engines = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+if SESSION_STORE not in session_engines:
+    raise ImproperlyConfigured(
+        f"Unknown SESSION_STORE {SESSION_STORE!r}; choose one of {', '.join(session_engines)}."
+    )
+SESSION_ENGINE = session_engines[SESSION_STORE]
+
+# Without REDIS_URL every worker has its own LocMemCache: "cache" sessions
+# only exist in the worker that created them, and a "cached_db" logout only
+# clears one worker's copy. Require a shared cache for both in production.
+if SESSION_STORE in ('cache', 'cached_db') and not DEBUG and not redis_url:
+    raise ImproperlyConfigured(f"SESSION_STORE={SESSION_STORE} requires REDIS_URL.")
+
+# Signed-cookie sessions are only as safe as SECRET_KEY: anyone who knows it
+# can forge a login. Refuse to run them in production on the committed key.
+if SESSION_STORE == 'signed_cookies' and not DEBUG and SECRET_KEY.startswith('django-insecure-'):
+    raise ImproperlyConfigured(
+        "SESSION_STORE=signed_cookies requires a private SECRET_KEY environment variable."
+    )
+
+
+# Attendance archiving (see tracker/archive.py): how many calendar years,
+# counting the current one, stay in the hot tables.
+ATTENDANCE_HOT_YEARS = int(os.environ.get("ATTENDANCE_HOT_YEARS", "2"))
 
 
 # Password validation
@@ -136,5 +244,16 @@ STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_DIRS = []
 
-# WhiteNoise configuration for Vercel
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
\ No newline at end of file
+# WhiteNoise configuration for Vercel: collectstatic writes content-hashed,
+# gzip- and (with Brotli installed) brotli-compressed copies of every file,
+# and WhiteNoise serves the hashed names with far-future cache headers.
+# STATICFILES_STORAGE is ignored since Django 5.1, hence STORAGES. See
+# core/storage.py for what happens when the manifest is not deployed.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'core.storage.StaticFilesStorage',
+    },
+}
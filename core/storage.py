@@ -0,0 +1,21 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    Hashed, compressed static files that degrade to plain URLs.
+
+    On Vercel, collectstatic runs in the static build, and staticfiles.json
+    is not guaranteed to be bundled with the Python functions. When the
+    manifest or the collected file is missing, ``{% static %}`` returns the
+    unhashed name, which the static build still serves (without the
+    immutable cache header), instead of failing the page with a 500.
+    """
+
+    manifest_strict = False
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            return name
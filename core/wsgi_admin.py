@@ -0,0 +1,19 @@
+"""
+WSGI entry point that always loads the Django admin.
+
+With LEAN_STARTUP the main entry point (core/wsgi.py) leaves the admin out to
+keep cold starts short; vercel.json routes /admin/ here instead, so the admin
+is only imported by the function instance that actually serves it.
+"""
+
+import os
+
+from django.core.wsgi import get_wsgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+os.environ['ADMIN_ENABLED'] = 'True'
+
+application = get_wsgi_application()
+
+# Vercel relies on the variable `app` to find the WSGI application
+app = application
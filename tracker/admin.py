@@ -1,13 +1,78 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
 from .models import Attendance
 from .models import DailyReport
 
 
-class AttendanceAdmin(admin.ModelAdmin):
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that takes the row count of an unfiltered changelist from the
+    PostgreSQL planner statistics instead of running COUNT(*) over the table.
+
+    Filtered changelists, small tables and other databases get an exact count.
+    """
+
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+        return super().count
+
+
+def estimated_row_count(model, using):
+    """Planner estimate of the rows in ``model``'s table, or None if there is none."""
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 for tables that have never been analyzed.
+    return row[0] if row and row[0] >= 0 else None
+
+
+class DeferringChangeList(ChangeList):
+    """Leaves ``ModelAdmin.changelist_defer`` columns out of the changelist query."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.defer(*self.model_admin.changelist_defer)
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist settings for the per-employee, per-day tables, which grow to
+    millions of rows: one joined query for the employee, no full-table count,
+    and a date drill-down backed by the ``date`` index.
+    """
+
+    list_select_related = ('employee',)
+    date_hierarchy = 'date'
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    changelist_defer = ()
+
+    def get_changelist(self, request, **kwargs):
+        return DeferringChangeList
+
+
+class AttendanceAdmin(LargeTableAdmin):
     list_display = ('employee', 'date', 'status', 'check_in_time', 'check_out_time', 'extra_days')
     list_filter = ('status', 'date', 'extra_days')
     search_fields = ('employee__username',)
-    
+
     fieldsets = (
         ('Employee Information', {
             'fields': ('employee', 'date')
@@ -19,21 +84,24 @@ class AttendanceAdmin(admin.ModelAdmin):
             'fields': ('extra_days',)
         }),
     )
-    
+
     def has_add_permission(self, request):
         return True
-    
+
     def has_change_permission(self, request, obj=None):
         return True
-    
+
     def has_delete_permission(self, request, obj=None):
         return True
 
 
-class DailyReportAdmin(admin.ModelAdmin):
+class DailyReportAdmin(LargeTableAdmin):
     list_display = ('employee', 'date')
     list_filter = ('date',)
     search_fields = ('employee__username',)
+    changelist_defer = (
+        'additional_actions', 'outcomes', 'weekly_plan', 'dau_metric', 'grades_qa', 'team_metrics',
+    )
 
 
 admin.site.register(Attendance, AttendanceAdmin)
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class TrackerConfig(AppConfig):
     name = 'tracker'
+
+    def ready(self):
+        # Connects the signal handlers that bump the fragment cache versions.
+        from . import data_versions  # noqa: F401
@@ -0,0 +1,132 @@
+"""
+Hot/cold split of attendance and daily reports.
+
+Rows dated before ``archive_cutoff()`` (1 January of the oldest year kept hot,
+see ``settings.ATTENDANCE_HOT_YEARS``) are moved into ``ArchivedAttendance``
+and ``ArchivedDailyReport`` by ``manage.py archive_attendance``. Day-to-day
+queries only touch the hot tables. Code that reads a date range goes through
+``attendance_records()``, which adds the archive only when the range reaches
+back past the cutoff.
+"""
+
+from datetime import date
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .data_versions import batched_bumps
+from .models import ArchivedAttendance, ArchivedDailyReport, Attendance, DailyReport
+
+
+def archive_cutoff(today=None):
+    """First date that stays in the hot tables."""
+    today = today or timezone.localdate()
+    return date(today.year - settings.ATTENDANCE_HOT_YEARS + 1, 1, 1)
+
+
+def needs_archive(start_date=None, end_date=None):
+    """
+    Whether a date range reaches the archive. Without either bound the range
+    is the hot set only; with just ``end_date`` it reaches back from there.
+    """
+    earliest = start_date or end_date
+    if earliest is None:
+        return False
+    # Past the computed cutoff, ask the archive itself: it may reach later if
+    # ATTENDANCE_HOT_YEARS was raised after rows were archived.
+    return earliest < archive_cutoff() or ArchivedAttendance.objects.filter(date__gte=earliest).exists()
+
+
+class ChainedRecords:
+    """
+    Hot rows followed by archived rows, in that order.
+
+    Archived rows are all older than hot ones, so for newest-first listings
+    this is already sorted, and slicing it (as Paginator does) only queries
+    the archive for pages that reach past the hot rows.
+    """
+
+    def __init__(self, hot, archived):
+        self.hot = hot
+        self.archived = archived
+        self._hot_count = None
+
+    def hot_count(self):
+        if self._hot_count is None:
+            self._hot_count = self.hot.count()
+        return self._hot_count
+
+    def count(self):
+        return self.hot_count() + self.archived.count()
+
+    def __len__(self):
+        return self.count()
+
+    def __iter__(self):
+        yield from self.hot
+        yield from self.archived
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        start, stop = index.start or 0, index.stop
+        hot_count = self.hot_count()
+        rows = list(self.hot[start:stop]) if start < hot_count else []
+        if stop is None or stop > hot_count:
+            archived_stop = None if stop is None else stop - hot_count
+            rows += list(self.archived[max(start - hot_count, 0):archived_stop])
+        return rows
+
+
+def attendance_records(start_date=None, end_date=None, include_archive=None, select_related=(),
+                       order_by=('-date', '-pk'), **filters):
+    """
+    Attendance matching ``filters`` between ``start_date`` and ``end_date``
+    (or all of it, with ``include_archive=True``). Returns a plain queryset
+    when the hot table covers the range, ``ChainedRecords`` otherwise.
+
+    The default ordering ends on the primary key: many rows share a date, and
+    LIMIT/OFFSET over tied sort keys may repeat or skip rows between pages.
+    """
+    if include_archive is None:
+        include_archive = needs_archive(start_date, end_date)
+    if start_date is not None:
+        filters['date__gte'] = start_date
+    if end_date is not None:
+        filters['date__lte'] = end_date
+    hot = Attendance.objects.select_related(*select_related).filter(**filters).order_by(*order_by)
+    if not include_archive:
+        return hot
+    archived = ArchivedAttendance.objects.select_related(*select_related).filter(**filters).order_by(*order_by)
+    return ChainedRecords(hot, archived)
+
+
+def _move(source, target, cutoff, batch_size):
+    fields = [f.attname for f in source._meta.concrete_fields if not f.primary_key]
+    moved = 0
+    while True:
+        with transaction.atomic():
+            batch = list(source.objects.filter(date__lt=cutoff).order_by('pk')[:batch_size])
+            if not batch:
+                return moved
+            target.objects.bulk_create(
+                # Raw values: compressed text is copied without decompressing it.
+                target(**{name: row.__dict__[name] for name in fields}) for row in batch
+            )
+            source.objects.filter(pk__in=[row.pk for row in batch]).delete()
+        moved += len(batch)
+
+
+def archive_closed_periods(cutoff=None, batch_size=1000):
+    """
+    Move attendance and daily reports dated before ``cutoff`` into the
+    archive tables, one batch per transaction. Returns the moved row counts.
+    """
+    cutoff = cutoff or archive_cutoff()
+    # Each deleted row would bump its version; once per table is enough.
+    with batched_bumps():
+        return (
+            _move(Attendance, ArchivedAttendance, cutoff, batch_size),
+            _move(DailyReport, ArchivedDailyReport, cutoff, batch_size),
+        )
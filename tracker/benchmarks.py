@@ -0,0 +1,74 @@
+"""
+Shared helpers for the benchmark_* management commands.
+
+Benchmarks run against the configured database inside a transaction that is
+rolled back, so they can be pointed at a copy of production safely.
+"""
+
+import random
+from contextlib import contextmanager
+from datetime import time, timedelta
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import override_settings
+from django.utils import timezone
+
+from .data_versions import ATTENDANCE, DAILY_REPORTS, EMPLOYEES, bump_version
+from .models import Attendance, DailyReport, EmployeeProfile
+
+# Benchmarks render pages without requiring collectstatic to have run first.
+BENCHMARK_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+@contextmanager
+def rolled_back():
+    """Run the block in a transaction that is always rolled back."""
+    with override_settings(STORAGES=BENCHMARK_STORAGES), transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def seed_dataset(employees=50, days=365, seed=0):
+    """
+    Create the benchmark dataset: ``employees`` employees with one attendance
+    row and one daily report per day for the last ``days`` days.
+    """
+    rng = random.Random(seed)
+    teams = [choice[0] for choice in EmployeeProfile.TEAM_CHOICES]
+    statuses = [choice[0] for choice in Attendance.STATUS_CHOICES]
+    today = timezone.now().date()
+
+    users = User.objects.bulk_create(
+        User(username=f'bench-employee-{i}') for i in range(employees)
+    )
+    EmployeeProfile.objects.bulk_create(
+        EmployeeProfile(user=user, team=teams[i % len(teams)]) for i, user in enumerate(users)
+    )
+    attendance, reports = [], []
+    for user in users:
+        for offset in range(days):
+            date = today - timedelta(days=offset)
+            attendance.append(Attendance(
+                employee=user,
+                date=date,
+                status=rng.choice(statuses),
+                check_in_time=time(9, rng.randrange(60)),
+                check_out_time=time(17, rng.randrange(60)),
+                extra_days=date.weekday() == 6,
+            ))
+            reports.append(DailyReport(
+                employee=user,
+                date=date,
+                outcomes='Closed tickets and reviewed pull requests. ' * rng.randrange(1, 20),
+                weekly_plan='Ship the next milestone.',
+                team_metrics={'new_leads': rng.randrange(10)},
+            ))
+    Attendance.objects.bulk_create(attendance, batch_size=1000)
+    DailyReport.objects.bulk_create(reports, batch_size=1000)
+    # bulk_create sends no save signals.
+    bump_version(ATTENDANCE, DAILY_REPORTS, EMPLOYEES)
+    return users
@@ -0,0 +1,101 @@
+"""
+Data versions for template fragment caching.
+
+Each helper returns a short string that changes whenever the rows behind a
+cached fragment change, so it can be passed to ``{% cache %}`` as a vary-on
+argument.
+
+Table-wide versions are counters in ``DataVersion`` rows, bumped by the save
+and delete signals below. Deletes bump inside the deleting transaction;
+post_save runs after ``save()`` has committed under autocommit, so there the
+bump is its own transaction. A reader in between caches the new rows under
+the old version, which only means they are fetched again once it moves on.
+Reading versions is a single-row lookup instead of a scan over the tables,
+and because they live in the database they stay correct when several
+workers each keep their own cache. Bulk operations skip signals and must
+call ``bump_version()`` themselves (see ``batched_bumps()``).
+
+Every bump is an UPDATE of the same row on the primary, so concurrent
+check-ins queue on that row lock for the length of the bump.
+
+Versions for one employee's rows come from the rows themselves (row count
+plus newest ``updated_at``), which only scans that employee's rows.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.contrib.auth.models import User
+from django.db.models import Count, F, Max
+from django.db.models.signals import post_delete, post_save
+
+from .models import (
+    ArchivedAttendance,
+    ArchivedDailyReport,
+    Attendance,
+    DailyReport,
+    DataVersion,
+    EmployeeProfile,
+)
+
+ATTENDANCE = 'attendance'
+DAILY_REPORTS = 'daily_reports'
+EMPLOYEES = 'employees'
+
+VERSIONED_MODELS = {
+    Attendance: ATTENDANCE,
+    ArchivedAttendance: ATTENDANCE,
+    DailyReport: DAILY_REPORTS,
+    ArchivedDailyReport: DAILY_REPORTS,
+    User: EMPLOYEES,
+    EmployeeProfile: EMPLOYEES,
+}
+
+# Names bumped inside a batched_bumps() block, bumped once when it ends.
+_pending_bumps = ContextVar('pending_version_bumps', default=None)
+
+
+def bump_version(*names):
+    pending = _pending_bumps.get()
+    if pending is not None:
+        pending.update(names)
+        return
+    for name in names:
+        if not DataVersion.objects.filter(name=name).update(version=F('version') + 1):
+            DataVersion.objects.get_or_create(name=name, defaults={'version': 1})
+
+
+@contextmanager
+def batched_bumps():
+    """Bump each version changed inside the block once, instead of once per row."""
+    pending = set()
+    token = _pending_bumps.set(pending)
+    try:
+        yield
+    finally:
+        _pending_bumps.reset(token)
+        bump_version(*pending)
+
+
+def table_versions(*names):
+    """Current versions of ``names``, in order, from one query."""
+    stored = dict(DataVersion.objects.filter(name__in=names).values_list('name', 'version'))
+    return [str(stored.get(name, 0)) for name in names]
+
+
+def _bump_for_instance(sender, instance, update_fields=None, **kwargs):
+    # Logins save last_login only, which no cached fragment shows.
+    if sender is User and update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    bump_version(VERSIONED_MODELS[sender])
+
+
+for model in VERSIONED_MODELS:
+    post_save.connect(_bump_for_instance, sender=model, dispatch_uid=f'data-version-save-{model.__name__}')
+    post_delete.connect(_bump_for_instance, sender=model, dispatch_uid=f'data-version-delete-{model.__name__}')
+
+
+def attendance_version(**filters):
+    stats = Attendance.objects.filter(**filters).aggregate(rows=Count('pk'), changed=Max('updated_at'))
+    changed = stats['changed'].timestamp() if stats['changed'] else 0
+    return f"{stats['rows']}-{changed}"
@@ -0,0 +1,139 @@
+import zlib
+from functools import cache
+
+from django import forms
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+
+# First byte of every stored value. Short texts do not shrink under zlib, so
+# they are kept as plain UTF-8 behind their own marker.
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+class CompressedBytes(bytes):
+    """A stored value as read from the database, not yet decompressed."""
+
+    def decompress(self):
+        marker, payload = self[:1], self[1:]
+        if marker == _ZLIB:
+            payload = zlib.decompress(payload)
+        return payload.decode("utf-8")
+
+
+def compress(text):
+    raw = text.encode("utf-8")
+    packed = zlib.compress(raw)
+    return _ZLIB + packed if len(packed) < len(raw) else _RAW + raw
+
+
+def _plain(value):
+    return value.decompress() if isinstance(value, CompressedBytes) else value
+
+
+class _DecompressingIterable:
+    """Mixin for the values()/values_list() iterables that decompresses results."""
+
+    def __iter__(self):
+        for row in super().__iter__():
+            if isinstance(row, dict):
+                yield {key: _plain(value) for key, value in row.items()}
+            elif hasattr(row, "_make"):
+                yield row._make(map(_plain, row))
+            elif isinstance(row, tuple):
+                yield tuple(map(_plain, row))
+            else:
+                yield _plain(row)
+
+
+@cache
+def _decompressing(iterable_class):
+    return type(f"Decompressing{iterable_class.__name__}", (_DecompressingIterable, iterable_class), {})
+
+
+class CompressedTextQuerySet(models.QuerySet):
+    """
+    QuerySet for models with a ``CompressedTextField``.
+
+    Model instances decompress on attribute access. values() and values_list()
+    have no instance to do that, so their rows are decompressed here instead
+    of returning the stored bytes.
+    """
+
+    def values(self, *fields, **expressions):
+        clone = super().values(*fields, **expressions)
+        clone._iterable_class = _decompressing(clone._iterable_class)
+        return clone
+
+    def values_list(self, *fields, flat=False, named=False):
+        clone = super().values_list(*fields, flat=flat, named=named)
+        clone._iterable_class = _decompressing(clone._iterable_class)
+        return clone
+
+
+class CompressedTextDescriptor(DeferredAttribute):
+    """Decompress on first attribute access instead of when the row is loaded."""
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if isinstance(value, CompressedBytes):
+            value = instance.__dict__[self.field.attname] = value.decompress()
+        return value
+
+    def __set__(self, instance, value):
+        # Defining __set__ makes this a data descriptor, so __get__ runs even
+        # once the loaded value sits in the instance __dict__.
+        instance.__dict__[self.field.attname] = value
+
+
+class CompressedTextField(models.Field):
+    """
+    A TextField stored zlib-compressed in a binary column.
+
+    Values are plain ``str`` in Python. Rows that are loaded but never read
+    are never decompressed, and saving an untouched value writes the stored
+    bytes back as they are. The column cannot be searched with text lookups.
+
+    Give the model a ``CompressedTextQuerySet`` manager so values() and
+    values_list() return text too; with a plain manager they return the
+    stored bytes.
+    """
+
+    descriptor_class = CompressedTextDescriptor
+
+    def get_internal_type(self):
+        return "BinaryField"
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return CompressedBytes(value)
+
+    def to_python(self, value):
+        if isinstance(value, CompressedBytes):
+            return value.decompress()
+        if value is None or isinstance(value, str):
+            return value
+        return str(value)
+
+    def pre_save(self, model_instance, add):
+        # Read past the descriptor so unread values are not decompressed
+        # only to be compressed again.
+        if self.attname in model_instance.__dict__:
+            return model_instance.__dict__[self.attname]
+        return super().pre_save(model_instance, add)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if value is None:
+            return value
+        if not isinstance(value, CompressedBytes):
+            value = compress(self.to_python(value))
+        return connection.Database.Binary(bytes(value))
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
+
+    def formfield(self, **kwargs):
+        return super().formfield(**{"widget": forms.Textarea, **kwargs})
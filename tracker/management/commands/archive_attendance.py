@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from tracker.archive import archive_closed_periods, archive_cutoff
+from tracker.models import Attendance, DailyReport
+
+
+class Command(BaseCommand):
+    help = (
+        "Move attendance and daily reports from closed periods into the archive "
+        "tables. By default everything before 1 January of the oldest year "
+        "kept by ATTENDANCE_HOT_YEARS is moved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--before", type=parse_date, help="Archive rows dated before YYYY-MM-DD instead (no later than the default)."
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true", help="Only count the rows that would move.")
+
+    def handle(self, *args, **options):
+        cutoff = options["before"] or archive_cutoff()
+        if cutoff > archive_cutoff():
+            # Views only read the archive for ranges before archive_cutoff(),
+            # so rows archived past it would drop out of the default listings.
+            raise CommandError(f"--before must not be later than the archive cutoff, {archive_cutoff()}.")
+        if options["dry_run"]:
+            attendance = Attendance.objects.filter(date__lt=cutoff).count()
+            reports = DailyReport.objects.filter(date__lt=cutoff).count()
+            self.stdout.write(
+                f"Would archive {attendance} attendance record(s) and {reports} daily report(s) before {cutoff}."
+            )
+            return
+        attendance, reports = archive_closed_periods(cutoff, options["batch_size"])
+        self.stdout.write(
+            f"Archived {attendance} attendance record(s) and {reports} daily report(s) before {cutoff}."
+        )
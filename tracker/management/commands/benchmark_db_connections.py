@@ -0,0 +1,69 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connections
+
+from tracker.models import Attendance
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure per-request database latency with and without persistent "
+        "connections. Point DATABASE_URL at a local Postgres (or at a PgBouncer "
+        "in front of it, with DB_SERVER_SIDE_POOLING=True) to compare setups."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--database", default="default")
+        parser.add_argument(
+            "--conn-max-age",
+            type=int,
+            default=600,
+            help="CONN_MAX_AGE used for the persistent run.",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        original = dict(connection.settings_dict)
+        self.stdout.write(
+            f"{connection.vendor} via {original.get('HOST') or original['NAME']}, "
+            f"{options['requests']} requests per mode"
+        )
+        modes = [
+            ("new connection per request", 0, False),
+            ("persistent", options["conn_max_age"], False),
+            ("persistent + health checks", options["conn_max_age"], True),
+        ]
+        try:
+            for label, max_age, health_checks in modes:
+                connection.close()
+                connection.settings_dict["CONN_MAX_AGE"] = max_age
+                connection.settings_dict["CONN_HEALTH_CHECKS"] = health_checks
+                timings = self.run_requests(options["requests"], options["database"])
+                self.report(label, timings)
+        finally:
+            connection.close()
+            connection.settings_dict.update(original)
+
+    def run_requests(self, count, using):
+        timings = []
+        for _ in range(count):
+            start = time.perf_counter()
+            # Go through the same signals as a real request, so Django's
+            # close_old_connections() applies CONN_MAX_AGE as it would live.
+            request_started.send(sender=self.__class__)
+            Attendance.objects.using(using).filter(employee_id=0).exists()
+            request_finished.send(sender=self.__class__)
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings
+
+    def report(self, label, timings):
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        self.stdout.write(
+            f"{label:<28} mean {statistics.mean(timings):7.2f} ms  "
+            f"p50 {statistics.median(timings):7.2f} ms  p95 {p95:7.2f} ms"
+        )
@@ -0,0 +1,55 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from tracker.benchmarks import rolled_back, seed_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the admin dashboard and an employee's attendance page against "
+        "the benchmark dataset, first with cold and then with warm fragment "
+        "caches. Runs in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employees", type=int, default=50)
+        parser.add_argument("--days", type=int, default=365)
+        parser.add_argument("--repeat", type=int, default=5, help="Warm renders to average.")
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            employees = seed_dataset(options["employees"], options["days"])
+            self.stdout.write(
+                f"{options['employees']} employees x {options['days']} days of attendance and reports"
+            )
+
+            admin = Client()
+            admin.force_login(User.objects.create_superuser("bench-admin", password="unused"))
+            self.measure("admin dashboard", admin, reverse("admin_dashboard"), options["repeat"])
+
+            employee = Client()
+            employee.force_login(employees[0])
+            self.measure("mark attendance", employee, reverse("mark_attendance"), options["repeat"])
+
+    def measure(self, label, client, url, repeat):
+        cold_ms, cold_queries = self.render(client, url)
+        warm = [self.render(client, url) for _ in range(repeat)]
+        warm_ms = sum(ms for ms, _ in warm) / repeat
+        self.stdout.write(
+            f"{label:<16} cold {cold_ms:8.1f} ms {cold_queries:5} queries   "
+            f"warm {warm_ms:8.1f} ms {warm[-1][1]:5} queries"
+        )
+
+    def render(self, client, url):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = client.get(url)
+            elapsed = (time.perf_counter() - start) * 1000
+        assert response.status_code == 200, response.status_code
+        return elapsed, len(queries)
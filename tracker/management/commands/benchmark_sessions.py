@@ -0,0 +1,36 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from tracker.benchmarks import rolled_back
+
+
+class Command(BaseCommand):
+    help = (
+        "Count database queries for one employee check-in (POST, redirect, GET) "
+        "under each session store. Runs in a transaction that is rolled back."
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'session store':<16} {'POST':>5} {'GET':>5} {'total':>6}")
+        for store in ("db", "cached_db", "cache", "signed_cookies"):
+            with override_settings(SESSION_ENGINE=f"django.contrib.sessions.backends.{store}"):
+                post, get = self.check_in()
+            self.stdout.write(f"{store:<16} {post:>5} {get:>5} {post + get:>6}")
+
+    def check_in(self):
+        with rolled_back():
+            employee = User.objects.create_user("benchmark-sessions", password="unused")
+            client = Client()
+            client.force_login(employee)
+            url = reverse("mark_attendance")
+            # Warm up: the first GET creates today's empty DailyReport.
+            client.get(url)
+            with CaptureQueriesContext(connection) as post:
+                client.post(url, {"status": "Present"})
+            with CaptureQueriesContext(connection) as get:
+                client.get(url)
+        return len(post), len(get)
@@ -0,0 +1,136 @@
+import collections
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter: this process has already paid for startup.
+# Prints one JSON line with phase and per-app timings (in ms) on stdout;
+# -X importtime (if enabled) writes the per-module import report to stderr.
+PROBE = r"""
+import json, os, time
+from django.apps.config import AppConfig
+
+timings = {"phases": {}, "apps": {}}
+start = time.perf_counter()
+
+def timed(app_label, phase, func):
+    def wrapper(*args, **kwargs):
+        t = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            app = timings["apps"].setdefault(app_label, {})
+            app[phase] = (time.perf_counter() - t) * 1000
+    return wrapper
+
+create = AppConfig.create.__func__
+
+def timed_create(cls, entry):
+    t = time.perf_counter()
+    app_config = create(cls, entry)
+    timings["apps"][app_config.label] = {"import": (time.perf_counter() - t) * 1000}
+    app_config.import_models = timed(app_config.label, "models", app_config.import_models)
+    app_config.ready = timed(app_config.label, "ready", app_config.ready)
+    return app_config
+
+AppConfig.create = classmethod(timed_create)
+
+def phase(name, func):
+    t = time.perf_counter()
+    result = func()
+    timings["phases"][name] = (time.perf_counter() - t) * 1000
+    return result
+
+import django
+from django.conf import settings
+phase("settings", lambda: settings.INSTALLED_APPS)
+phase("apps", django.setup)
+from django.urls import get_resolver
+phase("urlconf", lambda: get_resolver().url_patterns)
+from django.core.wsgi import get_wsgi_application
+phase("wsgi handler", get_wsgi_application)
+from django.test import Client
+response = phase("first request", lambda: Client().get(os.environ["PROFILE_STARTUP_PATH"]))
+timings["status"] = response.status_code
+timings["total"] = (time.perf_counter() - start) * 1000
+print(json.dumps(timings))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile a cold start in a fresh interpreter: settings, app loading "
+        "(per app), URLconf, WSGI handler and the first request, plus import "
+        "time grouped by module."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/login/", help="URL for the first request.")
+        parser.add_argument("--top", type=int, default=15, help="Number of modules to list.")
+        parser.add_argument(
+            "--lean",
+            action="store_true",
+            help="Profile with LEAN_STARTUP=True regardless of the current setting.",
+        )
+        parser.add_argument(
+            "--no-imports",
+            action="store_true",
+            help="Skip the per-module import report; -X importtime inflates the timings.",
+        )
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, PROFILE_STARTUP_PATH=options["path"])
+        if options["lean"]:
+            env["LEAN_STARTUP"] = "True"
+            env.pop("ADMIN_ENABLED", None)
+        python = [sys.executable] if options["no_imports"] else [sys.executable, "-X", "importtime"]
+        result = subprocess.run(
+            python + ["-c", PROBE],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            raise CommandError(result.stderr.strip().splitlines()[-1])
+        timings = json.loads(result.stdout.strip().splitlines()[-1])
+
+        self.stdout.write(
+            f"Cold start {timings['total']:.1f} ms "
+            f"(first request to {options['path']} -> {timings['status']})"
+        )
+        self.stdout.write("\nPhases:")
+        for name, ms in timings["phases"].items():
+            self.stdout.write(f"  {name:<16} {ms:8.1f} ms")
+
+        self.stdout.write("\nApps (import / models / ready):")
+        for label, app in timings["apps"].items():
+            self.stdout.write(
+                f"  {label:<16} {app.get('import', 0):6.1f} / "
+                f"{app.get('models', 0):6.1f} / {app.get('ready', 0):6.1f} ms"
+            )
+
+        if options["no_imports"]:
+            return
+        self.stdout.write(f"\nImport time by module (top {options['top']}):")
+        for module, ms in self.group_imports(result.stderr).most_common(options["top"]):
+            self.stdout.write(f"  {module:<32} {ms:8.1f} ms")
+
+    def group_imports(self, importtime_report):
+        """Sum self import time per package (per subpackage for django)."""
+        grouped = collections.Counter()
+        for line in importtime_report.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            self_us, _, module = line[len("import time:"):].split("|")
+            if not self_us.strip().isdigit():
+                continue  # column header
+            parts = module.strip().split(".")
+            depth = 3 if parts[:2] in (["django", "contrib"], ["django", "db"]) else 2
+            depth = depth if parts[0] == "django" else 1
+            grouped[".".join(parts[:depth])] += int(self_us) / 1000
+        return grouped
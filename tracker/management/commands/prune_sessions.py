@@ -0,0 +1,27 @@
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired rows from django_session in small batches. Unlike "
+        "clearsessions this never holds one long DELETE on the remote database, "
+        "so it is safe to run from a periodic job during working hours."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        deleted = 0
+        while True:
+            batch = list(
+                Session.objects.filter(expire_date__lt=now)
+                .values_list("pk", flat=True)[: options["batch_size"]]
+            )
+            if not batch:
+                break
+            deleted += Session.objects.filter(pk__in=batch).delete()[0]
+        self.stdout.write(f"Deleted {deleted} expired session(s).")
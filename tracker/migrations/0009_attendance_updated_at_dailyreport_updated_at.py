@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0008_remove_dailyreport_today_actions_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendance',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='dailyreport',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0009_attendance_updated_at_dailyreport_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedAttendance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('status', models.CharField(choices=[('Present', 'Present'), ('Absent', 'Absent'), ('WFH', 'Work From Home'), ('Leave', 'Leave'), ('Half Day', 'Half Day')], max_length=20)),
+                ('check_in_time', models.TimeField(blank=True, null=True)),
+                ('check_out_time', models.TimeField(blank=True, null=True)),
+                ('extra_days', models.BooleanField(default=False, help_text='Check if worked on Sunday or weekend')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['employee', 'date'], name='tracker_arc_employe_d89394_idx'), models.Index(fields=['date'], name='tracker_arc_date_ad00f5_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedDailyReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('additional_actions', models.TextField(blank=True, default='')),
+                ('outcomes', models.TextField()),
+                ('weekly_plan', models.TextField()),
+                ('dau_metric', models.TextField(blank=True, default='')),
+                ('grades_qa', models.TextField(blank=True, default='')),
+                ('team_metrics', models.JSONField(blank=True, default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['employee', 'date'], name='tracker_arc_employe_958ad3_idx'), models.Index(fields=['date'], name='tracker_arc_date_43e997_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,79 @@
+from django.db import migrations, models
+
+import tracker.fields
+
+TEXT_FIELDS = ['additional_actions', 'outcomes', 'weekly_plan', 'dau_metric', 'grades_qa']
+MODELS = ['dailyreport', 'archiveddailyreport']
+
+
+def copy_text(apps, source_suffix, target_suffix):
+    for model_name in MODELS:
+        model = apps.get_model('tracker', model_name)
+        targets = [f'{name}{target_suffix}' for name in TEXT_FIELDS]
+        batch = []
+        for report in model.objects.order_by('pk').iterator(chunk_size=500):
+            for name in TEXT_FIELDS:
+                setattr(report, f'{name}{target_suffix}', getattr(report, f'{name}{source_suffix}'))
+            batch.append(report)
+            if len(batch) == 500:
+                model.objects.bulk_update(batch, targets)
+                batch = []
+        model.objects.bulk_update(batch, targets)
+
+
+def compress_text(apps, schema_editor):
+    copy_text(apps, '', '_compressed')
+
+
+def decompress_text(apps, schema_editor):
+    copy_text(apps, '_compressed', '')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0010_archivedattendance_archiveddailyreport'),
+    ]
+
+    operations = [
+        *[
+            migrations.AddField(
+                model_name=model_name,
+                name=f'{name}_compressed',
+                field=tracker.fields.CompressedTextField(blank=True, default=''),
+            )
+            for model_name in MODELS
+            for name in TEXT_FIELDS
+        ],
+        migrations.RunPython(compress_text, decompress_text),
+        # Gives the required text columns a default so that unapplying
+        # RemoveField can re-add them to a table that already has rows.
+        *[
+            migrations.AlterField(
+                model_name=model_name,
+                name=name,
+                field=models.TextField(default=''),
+            )
+            for model_name in MODELS
+            for name in ('outcomes', 'weekly_plan')
+        ],
+        *[
+            migrations.RemoveField(model_name=model_name, name=name)
+            for model_name in MODELS
+            for name in TEXT_FIELDS
+        ],
+        *[
+            migrations.RenameField(model_name=model_name, old_name=f'{name}_compressed', new_name=name)
+            for model_name in MODELS
+            for name in TEXT_FIELDS
+        ],
+        *[
+            migrations.AlterField(
+                model_name=model_name,
+                name=name,
+                field=tracker.fields.CompressedTextField(),
+            )
+            for model_name in MODELS
+            for name in ('outcomes', 'weekly_plan')
+        ],
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:45
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class AddIndexConcurrentlyOnPostgres(AddIndexConcurrently):
+    """
+    CREATE INDEX CONCURRENTLY on PostgreSQL, so the hot tables keep taking
+    writes while the index builds. Other databases get a plain AddIndex.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('tracker', '0011_compress_dailyreport_text'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyOnPostgres(
+            model_name='attendance',
+            index=models.Index(fields=['employee', 'date'], name='tracker_att_employe_2453f4_idx'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='attendance',
+            index=models.Index(fields=['date'], name='tracker_att_date_4a8978_idx'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='dailyreport',
+            index=models.Index(fields=['employee', 'date'], name='tracker_dai_employe_86bfa4_idx'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='dailyreport',
+            index=models.Index(fields=['date'], name='tracker_dai_date_a2aaa3_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:53
+
+from django.db import migrations, models
+
+
+def create_versions(apps, schema_editor):
+    DataVersion = apps.get_model('tracker', 'DataVersion')
+    DataVersion.objects.bulk_create(
+        DataVersion(name=name) for name in ('attendance', 'daily_reports', 'employees')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0012_attendance_dailyreport_date_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_versions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0013_dataversion'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='archivedattendance',
+            name='updated_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='archiveddailyreport',
+            name='updated_at',
+            field=models.DateTimeField(),
+        ),
+    ]
@@ -1,8 +1,10 @@
 from django.db import models
 from django.contrib.auth.models import User
 
+from .fields import CompressedTextField, CompressedTextQuerySet
 
-class Attendance(models.Model):
+
+class AttendanceBase(models.Model):
     STATUS_CHOICES = [
         ('Present', 'Present'),
         ('Absent', 'Absent'),
@@ -17,6 +19,10 @@ class Attendance(models.Model):
     check_in_time = models.TimeField(null=True, blank=True)
     check_out_time = models.TimeField(null=True, blank=True)
     extra_days = models.BooleanField(default=False, help_text="Check if worked on Sunday or weekend")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
 
     def __str__(self):
         return f"{self.employee.username} - {self.date} - {self.status}"
@@ -33,6 +39,24 @@ class Attendance(models.Model):
         return 0
 
 
+class Attendance(AttendanceBase):
+    archived = False
+
+    class Meta:
+        indexes = [models.Index(fields=['employee', 'date']), models.Index(fields=['date'])]
+
+
+class ArchivedAttendance(AttendanceBase):
+    """Attendance from closed periods, moved out by `manage.py archive_attendance`."""
+
+    archived = True
+    # Not auto_now: archived rows keep the time they were last changed.
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [models.Index(fields=['employee', 'date']), models.Index(fields=['date'])]
+
+
 class EmployeeProfile(models.Model):
     TEAM_CHOICES = [
         ('Growth and Marketing', 'Growth and Marketing'),
@@ -45,20 +69,40 @@ class EmployeeProfile(models.Model):
         return f"{self.user.username} - {self.team}"
 
 
-class DailyReport(models.Model):
+class DailyReportBase(models.Model):
     employee = models.ForeignKey(User, on_delete=models.CASCADE)
     date = models.DateField()
-    additional_actions = models.TextField(blank=True, default="")
-    outcomes = models.TextField()
-    weekly_plan = models.TextField()
-    dau_metric = models.TextField(blank=True, default="")
-    grades_qa = models.TextField(blank=True, default="")
+    additional_actions = CompressedTextField(blank=True, default="")
+    outcomes = CompressedTextField()
+    weekly_plan = CompressedTextField()
+    dau_metric = CompressedTextField(blank=True, default="")
+    grades_qa = CompressedTextField(blank=True, default="")
     team_metrics = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = CompressedTextQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
 
     def __str__(self):
         return f"{self.employee.username} - {self.date}"
 
 
+class DailyReport(DailyReportBase):
+    class Meta:
+        indexes = [models.Index(fields=['employee', 'date']), models.Index(fields=['date'])]
+
+
+class ArchivedDailyReport(DailyReportBase):
+    """Daily reports from closed periods, moved out with their attendance."""
+
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [models.Index(fields=['employee', 'date']), models.Index(fields=['date'])]
+
+
 class GeneratedCredential(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     password = models.CharField(max_length=255)
@@ -66,3 +110,13 @@ class GeneratedCredential(models.Model):
 
     def __str__(self):
         return f"Credentials for {self.user.username}"
+
+
+class DataVersion(models.Model):
+    """Change counter for a group of tables, see tracker/data_versions.py."""
+
+    name = models.CharField(max_length=50, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
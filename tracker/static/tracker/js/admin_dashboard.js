@@ -0,0 +1,139 @@
+// Modal toggling
+function closeModal(id) {
+    document.getElementById(id).classList.remove('active');
+}
+
+// The report text is only fetched when a report is opened.
+function openReportModal(empName, date, reportUrl) {
+    if (!reportUrl) {
+        showReport(empName, date, '', '{}', '', '', '', '');
+        return;
+    }
+    // An expired session redirects to the login page, which is not JSON
+    // either, so that ends up in the catch below too.
+    fetch(reportUrl)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`Report request failed with ${response.status}`);
+            }
+            return response.json();
+        })
+        .then(report => showReport(
+            empName, date, report.additional_actions, JSON.stringify(report.team_metrics),
+            report.outcomes, report.weekly_plan, report.dau_metric, report.grades_qa
+        ))
+        .catch(() => showReport(
+            empName, date, '', '{}', 'Could not load report. Reload the page and try again.', '-', '-', '-'
+        ));
+}
+
+function showReport(empName, date, actions, metricsJson, outcomes, plan, dau, qa) {
+    document.getElementById('reportEmpName').textContent = empName;
+    document.getElementById('reportDate').textContent = date;
+
+    // Handle metrics
+    const metricsDiv = document.getElementById('reportMetrics');
+    const metricsSection = document.getElementById('reportMetricsSection');
+    metricsDiv.innerHTML = '';
+    try {
+        const metrics = JSON.parse(metricsJson || '{}');
+        if (Object.keys(metrics).length > 0) {
+            metricsSection.style.display = 'block';
+
+            if (metrics.hasOwnProperty('pu_conversions') || metrics.hasOwnProperty('new_leads')) {
+                // Growth and Marketing Formatting
+                metricsDiv.style.gridTemplateColumns = '1fr';
+
+                let html = '';
+                if (metrics.new_leads !== undefined) {
+                    html += `<div style="margin-bottom: 0.5rem;"><strong>1. Number of NEW leads:</strong> ${metrics.new_leads}</div>`;
+                }
+
+                html += `<div><strong>2. Number of conversions:</strong></div>`;
+                html += `<div style="padding-left: 1.5rem; display: grid; grid-template-columns: 1fr 1fr; gap: 0.5rem; margin-top: 0.5rem;">`;
+
+                if (metrics.pu_conversions !== undefined) html += `<div><span style="color:var(--text-muted)">- For PU College:</span> <strong>${metrics.pu_conversions}</strong></div>`;
+                if (metrics.lgs_conversions !== undefined) html += `<div><span style="color:var(--text-muted)">- For LGS:</span> <strong>${metrics.lgs_conversions}</strong></div>`;
+                if (metrics.summer_conversions !== undefined) html += `<div><span style="color:var(--text-muted)">- For Summer Coaching / Internship:</span> <strong>${metrics.summer_conversions}</strong></div>`;
+                if (metrics.cet_conversions !== undefined) html += `<div><span style="color:var(--text-muted)">- For CET/NEET Crash Course:</span> <strong>${metrics.cet_conversions}</strong></div>`;
+
+                html += `</div>`;
+                metricsDiv.innerHTML = html;
+
+            } else if (metrics.hasOwnProperty('lessons_completed') || metrics.hasOwnProperty('skills_added') || metrics.hasOwnProperty('new_features_added')) {
+                // Tech and Development Formatting
+                metricsDiv.style.gridTemplateColumns = '1fr 1fr';
+                let html = '';
+                if (metrics.lessons_completed !== undefined) html += `<div><strong>Lessons completed:</strong> ${metrics.lessons_completed}</div>`;
+                if (metrics.skills_added !== undefined) html += `<div><strong>Skills added:</strong> ${metrics.skills_added}</div>`;
+                if (metrics.students_mentored !== undefined) html += `<div><strong>Students mentored:</strong> ${metrics.students_mentored}</div>`;
+                if (metrics.hours_mentored !== undefined) html += `<div><strong>Hours mentored:</strong> ${metrics.hours_mentored}</div>`;
+                if (metrics.new_features_added !== undefined) html += `<div><strong>New features added:</strong> ${metrics.new_features_added}</div>`;
+                metricsDiv.innerHTML = html;
+            } else {
+                // Fallback
+                metricsDiv.style.gridTemplateColumns = '1fr 1fr';
+                for (const [key, value] of Object.entries(metrics)) {
+                    const formattedKey = key.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase());
+                    metricsDiv.innerHTML += `<div><strong>${formattedKey}:</strong> ${value}</div>`;
+                }
+            }
+        } else {
+            metricsSection.style.display = 'none';
+        }
+    } catch (e) {
+        metricsSection.style.display = 'none';
+    }
+
+    // Handle Also:
+    const alsoSection = document.getElementById('reportAlsoSection');
+    if (actions.trim() === '' || actions === 'No data') {
+        alsoSection.style.display = 'none';
+    } else {
+        alsoSection.style.display = 'block';
+        document.getElementById('reportAlso').textContent = actions;
+    }
+
+    document.getElementById('reportOutcomes').textContent = outcomes || 'No data';
+    document.getElementById('reportPlan').textContent = plan || 'No data';
+    document.getElementById('reportDau').textContent = dau || 'No data';
+    document.getElementById('reportQa').textContent = qa || 'No data';
+    document.getElementById('reportModal').classList.add('active');
+}
+
+function openEditModal(id, empName, date, status, checkIn, checkOut, extraDays) {
+    document.getElementById('editEmpName').textContent = empName;
+    document.getElementById('editDate').textContent = date;
+    document.getElementById('editStatus').value = status;
+    document.getElementById('editCheckIn').value = checkIn;
+    document.getElementById('editCheckOut').value = checkOut;
+    document.getElementById('editExtraDays').checked = (extraDays === 'True');
+    document.getElementById('editForm').action = `/edit-attendance/${id}/`;
+    document.getElementById('editModal').classList.add('active');
+}
+
+function openDeleteModal(id, empName, date) {
+    document.getElementById('deleteEmpName').textContent = empName;
+    document.getElementById('deleteDate').textContent = date;
+    document.getElementById('deleteForm').action = `/delete-attendance/${id}/`;
+    document.getElementById('deleteModal').classList.add('active');
+}
+
+// Hide toasts after 4 seconds
+setTimeout(() => {
+    const container = document.getElementById('toastContainer');
+    if (container) {
+        if (container.innerHTML.includes("Password:")) {
+            // if it's a password toast, keep it open for 60 seconds
+            setTimeout(() => {
+                container.style.opacity = '0';
+                container.style.transition = 'opacity 0.5s ease';
+                setTimeout(() => container.remove(), 500);
+            }, 60000);
+        } else {
+            container.style.opacity = '0';
+            container.style.transition = 'opacity 0.5s ease';
+            setTimeout(() => container.remove(), 500);
+        }
+    }
+}, 4000);
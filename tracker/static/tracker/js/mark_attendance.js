@@ -0,0 +1,21 @@
+// Auto-expand textareas
+document.querySelectorAll('textarea.auto-expand').forEach(el => {
+    el.addEventListener('input', function () {
+        this.style.height = 'auto';
+        this.style.height = (this.scrollHeight) + 'px';
+    });
+    // trigger on load
+    if (el.value) {
+        el.style.height = (el.scrollHeight) + 'px';
+    }
+});
+
+// Hide toasts after 4 seconds
+setTimeout(() => {
+    const container = document.getElementById('toastContainer');
+    if (container) {
+        container.style.opacity = '0';
+        container.style.transition = 'opacity 0.5s ease';
+        setTimeout(() => container.remove(), 500);
+    }
+}, 4000);
@@ -1,3 +1,477 @@
-from django.test import TestCase
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection, connections
+from django.test import Client, RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from core.db_routers import (
+    PRIMARY_DB_ALIAS,
+    RECENT_WRITE_COOKIE,
+    REPLICA_DB_ALIAS,
+    PrimaryReplicaRouter,
+    read_from_replica,
+    replica_configured,
+)
+
+from .archive import ChainedRecords, archive_cutoff, attendance_records
+from .data_versions import ATTENDANCE, EMPLOYEES, table_versions
+from .fields import CompressedBytes
+from .models import ArchivedAttendance, ArchivedDailyReport, Attendance, DailyReport
+
+# The manifest storage needs collectstatic to have run; tests render pages
+# against the unhashed source files instead.
+TEST_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+# The storages the project deploys with, for the tests that run collectstatic.
+DEPLOYED_STORAGES = settings.STORAGES
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class TrackerTestCase(TestCase):
+    """
+    Renders pages against the unhashed static files, with an empty cache and
+    every read on the test database, even when a replica is configured.
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        patcher = mock.patch('core.db_routers.replica_configured', return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class PrimaryReplicaRouterTests(TestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+        self.factory = RequestFactory()
+        patcher = mock.patch('core.db_routers.replica_configured', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def route_inside_view(self, method, callback, cookies=None):
+        @read_from_replica
+        def view(request):
+            return callback()
+        request = getattr(self.factory, method)('/')
+        request.COOKIES.update(cookies or {})
+        return view(request)
+
+    def test_reads_outside_replica_views_use_primary(self):
+        self.assertEqual(self.router.db_for_read(Attendance), PRIMARY_DB_ALIAS)
+
+    def test_reads_inside_replica_views_use_replica(self):
+        alias = self.route_inside_view('get', lambda: self.router.db_for_read(Attendance))
+        self.assertEqual(alias, REPLICA_DB_ALIAS)
+
+    def test_unsafe_methods_stay_on_primary(self):
+        alias = self.route_inside_view('post', lambda: self.router.db_for_read(Attendance))
+        self.assertEqual(alias, PRIMARY_DB_ALIAS)
+
+    def test_reads_after_a_write_are_pinned_to_primary(self):
+        def write_then_read():
+            self.assertEqual(self.router.db_for_write(Attendance), PRIMARY_DB_ALIAS)
+            return self.router.db_for_read(Attendance)
+
+        self.assertEqual(self.route_inside_view('get', write_then_read), PRIMARY_DB_ALIAS)
+        # The pin only lasts for the request that wrote.
+        alias = self.route_inside_view('get', lambda: self.router.db_for_read(Attendance))
+        self.assertEqual(alias, REPLICA_DB_ALIAS)
+
+    def test_clients_that_wrote_recently_read_from_primary(self):
+        alias = self.route_inside_view(
+            'get', lambda: self.router.db_for_read(Attendance), cookies={RECENT_WRITE_COOKIE: '1'}
+        )
+        self.assertEqual(alias, PRIMARY_DB_ALIAS)
+
+    @override_settings(STORAGES=TEST_STORAGES)
+    def test_dashboard_after_an_edit_reads_from_primary(self):
+        cache.clear()
+        employee = User.objects.create_user('worker')
+        record = Attendance.objects.create(employee=employee, date=timezone.now().date(), status='Present')
+        self.client.force_login(User.objects.create_superuser('boss', 'boss@example.com', 'pw'))
+
+        routed = []
+        db_for_read = PrimaryReplicaRouter.db_for_read
+
+        def spy(router, model, **hints):
+            routed.append(db_for_read(router, model, **hints))
+            return PRIMARY_DB_ALIAS
+
+        with mock.patch.object(PrimaryReplicaRouter, 'db_for_read', spy):
+            response = self.client.post(reverse('edit_attendance', args=[record.pk]), {'status': 'Leave'})
+            self.assertIn(RECENT_WRITE_COOKIE, response.cookies)
+            self.assertEqual(response.cookies[RECENT_WRITE_COOKIE]['max-age'], settings.REPLICA_LAG_SECONDS)
+            routed.clear()
+            response = self.client.get(response.url)
+        self.assertContains(response, 'badge-leave')
+        self.assertNotIn(REPLICA_DB_ALIAS, routed)
+
+        # Once the cookie has expired, the dashboard reads from the replica again.
+        del self.client.cookies[RECENT_WRITE_COOKIE]
+        with mock.patch.object(PrimaryReplicaRouter, 'db_for_read', spy):
+            self.client.get(reverse('admin_dashboard'))
+        self.assertIn(REPLICA_DB_ALIAS, routed)
+
+    def test_replica_is_never_migrated(self):
+        self.assertTrue(self.router.allow_migrate(PRIMARY_DB_ALIAS, 'tracker'))
+        self.assertFalse(self.router.allow_migrate(REPLICA_DB_ALIAS, 'tracker'))
+
+
+@skipUnless(replica_configured(), 'set DATABASE_REPLICA_URL to run against a replica alias')
+@override_settings(STORAGES=TEST_STORAGES)
+class ReplicaDashboardTests(TransactionTestCase):
+    # The test replica mirrors the default test database; a TransactionTestCase
+    # avoids holding SQLite write locks the mirror connection would block on.
+    databases = '__all__'
+
+    def test_admin_dashboard_reads_from_replica(self):
+        admin = User.objects.create_superuser('boss', 'boss@example.com', 'pw')
+        self.client.force_login(admin)
+        with CaptureQueriesContext(connections[REPLICA_DB_ALIAS]) as replica_queries:
+            response = self.client.get(reverse('admin_dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(replica_queries.captured_queries)
+
+
+class SessionStoreTests(TrackerTestCase):
+    def queries_for_check_in(self, username):
+        client = Client()
+        client.force_login(User.objects.create_user(username, password='pw'))
+        with CaptureQueriesContext(connection) as queries:
+            client.post(reverse('mark_attendance'), {'status': 'Present'}, follow=True)
+        return len(queries)
+
+    def test_signed_cookie_sessions_skip_the_session_table(self):
+        with override_settings(SESSION_ENGINE='django.contrib.sessions.backends.db'):
+            db_queries = self.queries_for_check_in('db-worker')
+        with override_settings(SESSION_ENGINE='django.contrib.sessions.backends.signed_cookies'):
+            cookie_queries = self.queries_for_check_in('cookie-worker')
+        # One django_session read saved on each of the POST and the redirected GET.
+        self.assertEqual(db_queries - cookie_queries, 2)
+
+    def test_prune_sessions_deletes_only_expired_rows(self):
+        now = timezone.now()
+        for i in range(5):
+            Session.objects.create(session_key=f'old{i}', session_data='', expire_date=now - timedelta(days=1))
+        Session.objects.create(session_key='live', session_data='', expire_date=now + timedelta(days=1))
+        out = StringIO()
+        call_command('prune_sessions', batch_size=2, stdout=out)
+        self.assertIn('Deleted 5 expired session(s).', out.getvalue())
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), ['live'])
+
+    def test_settings_reject_unsafe_session_stores(self):
+        def load_settings(**env):
+            env = {**os.environ, 'DEBUG': 'False', 'REDIS_URL': '', **env}
+            return subprocess.run(
+                [sys.executable, '-c', 'import core.settings'],
+                cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+            )
+
+        for store in ('cache', 'cached_db', 'memcached'):
+            result = load_settings(SESSION_STORE=store)
+            self.assertIn('ImproperlyConfigured', result.stderr)
+        self.assertEqual(load_settings(SESSION_STORE='cached_db', REDIS_URL='redis://cache:6379').returncode, 0)
+
+
+class StaticAssetTests(TrackerTestCase):
+    def test_pages_link_external_assets_instead_of_inlining_them(self):
+        self.client.force_login(User.objects.create_user('worker', password='pw'))
+        response = self.client.get(reverse('mark_attendance'))
+        self.assertContains(response, '/static/tracker/css/mark_attendance.css')
+        self.assertContains(response, '/static/tracker/js/mark_attendance.js')
+        self.assertNotContains(response, '<style>')
+
+
+    def render_with_deployed_storage(self, static_root, collect):
+        with override_settings(STORAGES=DEPLOYED_STORAGES, STATIC_ROOT=static_root):
+            if collect:
+                call_command('collectstatic', interactive=False, verbosity=0)
+            response = self.client.get(reverse('mark_attendance'))
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    @override_settings(DEBUG=False)
+    def test_pages_link_hashed_assets_after_collectstatic(self):
+        self.client.force_login(User.objects.create_user('worker', password='pw'))
+        with tempfile.TemporaryDirectory() as static_root:
+            response = self.render_with_deployed_storage(static_root, collect=True)
+        self.assertRegex(response.content.decode(), r'/static/tracker/css/mark_attendance\.[0-9a-f]{12}\.css')
+
+    @override_settings(DEBUG=False)
+    def test_pages_fall_back_to_plain_urls_without_a_manifest(self):
+        self.client.force_login(User.objects.create_user('worker', password='pw'))
+        with tempfile.TemporaryDirectory() as static_root:
+            response = self.render_with_deployed_storage(static_root, collect=False)
+        self.assertContains(response, '/static/tracker/css/mark_attendance.css')
+
+
+class FragmentCacheTests(TrackerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.employee = User.objects.create_user('worker', password='pw')
+        self.client.force_login(self.employee)
+        self.record = Attendance.objects.create(
+            employee=self.employee, date=timezone.now().date() - timedelta(days=1), status='Present'
+        )
+
+    def test_warm_history_skips_history_queries(self):
+        url = reverse('mark_attendance')
+        with CaptureQueriesContext(connection) as cold:
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as warm:
+            response = self.client.get(url)
+        self.assertLess(len(warm), len(cold))
+        self.assertContains(response, 'badge-present')
+
+    def test_history_is_rerendered_after_the_data_changes(self):
+        url = reverse('mark_attendance')
+        self.client.get(url)
+        self.record.status = 'Leave'
+        self.record.save()
+        response = self.client.get(url)
+        self.assertContains(response, 'badge-leave')
+        self.assertNotContains(response, 'badge-present')
+
+    def test_table_versions_change_on_save_and_delete_but_not_login(self):
+        before = table_versions(ATTENDANCE, EMPLOYEES)
+        self.client.force_login(self.employee)
+        self.assertEqual(table_versions(ATTENDANCE, EMPLOYEES), before)
+        self.record.save()
+        after_save = table_versions(ATTENDANCE)
+        self.record.delete()
+        self.assertEqual(len({before[0], after_save[0], table_versions(ATTENDANCE)[0]}), 3)
+
+    def test_warm_dashboard_does_not_scan_attendance_for_versions(self):
+        self.client.force_login(User.objects.create_superuser('boss', 'boss@example.com', 'pw'))
+        self.client.get(reverse('admin_dashboard'))
+        with CaptureQueriesContext(connection) as warm:
+            self.client.get(reverse('admin_dashboard'))
+        self.assertFalse(any('MAX(' in query['sql'] for query in warm))
+
+    def test_cached_dashboard_log_shows_renamed_employees(self):
+        self.client.force_login(User.objects.create_superuser('boss', 'boss@example.com', 'pw'))
+        self.client.get(reverse('admin_dashboard'))
+        self.employee.username = 'renamed-worker'
+        self.employee.save()
+        response = self.client.get(reverse('admin_dashboard'))
+        self.assertContains(response, f"openDeleteModal('{self.record.pk}', 'renamed-worker'")
+
+
+@override_settings(ATTENDANCE_HOT_YEARS=1)
+class ArchiveTests(TrackerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.employee = User.objects.create_user('worker', password='pw')
+        self.cutoff = archive_cutoff()
+        for days_ago in (1, 2):
+            Attendance.objects.create(employee=self.employee, date=self.cutoff - timedelta(days=days_ago), status='Absent')
+            DailyReport.objects.create(employee=self.employee, date=self.cutoff - timedelta(days=days_ago), outcomes='old', weekly_plan='')
+        Attendance.objects.create(employee=self.employee, date=self.cutoff, status='Present')
+
+    def archive(self):
+        call_command('archive_attendance', batch_size=1, stdout=StringIO())
+
+    def test_command_moves_rows_before_the_cutoff(self):
+        self.archive()
+        self.assertEqual(list(Attendance.objects.values_list('date', flat=True)), [self.cutoff])
+        self.assertEqual(ArchivedAttendance.objects.count(), 2)
+        self.assertEqual(ArchivedDailyReport.objects.count(), 2)
+        self.assertFalse(DailyReport.objects.exists())
+
+    def test_archived_rows_keep_their_last_change_time(self):
+        changed = timezone.now() - timedelta(days=400)
+        Attendance.objects.filter(date__lt=self.cutoff).update(updated_at=changed)
+        self.archive()
+        self.assertEqual(set(ArchivedAttendance.objects.values_list('updated_at', flat=True)), {changed})
+
+    def test_archive_link_follows_the_employees_archived_rows(self):
+        self.client.force_login(self.employee)
+        self.assertFalse(self.client.get(reverse('mark_attendance')).context['has_archived_history'])
+        self.archive()
+        self.assertTrue(self.client.get(reverse('mark_attendance')).context['has_archived_history'])
+
+    def test_archiving_bumps_each_version_once(self):
+        before = int(table_versions(ATTENDANCE)[0])
+        self.archive()
+        self.assertEqual(int(table_versions(ATTENDANCE)[0]), before + 1)
+
+    def test_command_refuses_to_archive_past_the_cutoff(self):
+        with self.assertRaises(CommandError):
+            call_command('archive_attendance', before=self.cutoff + timedelta(days=1), stdout=StringIO())
+        self.assertFalse(ArchivedAttendance.objects.exists())
+
+    def test_archive_is_read_where_it_reaches_past_a_raised_cutoff(self):
+        self.archive()
+        # Keeping one more year hot moves the cutoff before the archived rows.
+        with override_settings(ATTENDANCE_HOT_YEARS=2):
+            start_date = self.cutoff - timedelta(days=2)
+            self.assertLess(archive_cutoff(), start_date)
+            self.assertEqual(attendance_records(start_date=start_date).count(), 3)
+
+    def test_archive_is_only_read_for_ranges_before_the_cutoff(self):
+        self.archive()
+        self.assertEqual(attendance_records(start_date=self.cutoff).count(), 1)
+        records = attendance_records(start_date=self.cutoff - timedelta(days=30))
+        self.assertIsInstance(records, ChainedRecords)
+        self.assertEqual([r.archived for r in records[0:3]], [False, True, True])
+        self.assertEqual([r.date for r in records[1:2]], [self.cutoff - timedelta(days=1)])
+
+    def test_dashboard_pages_list_each_row_once(self):
+        for i in range(6):
+            user = User.objects.create_user(f'colleague{i}')
+            for day in (self.cutoff - timedelta(days=1), self.cutoff):
+                Attendance.objects.create(employee=user, date=day, status='Present')
+        self.archive()
+        self.client.force_login(User.objects.create_superuser('boss', 'boss@example.com', 'pw'))
+        params = {'start_date': (self.cutoff - timedelta(days=30)).isoformat()}
+        seen = []
+        with mock.patch('tracker.views.ATTENDANCE_LOG_PAGE_SIZE', 4):
+            page_obj = self.client.get(reverse('admin_dashboard'), params).context['page_obj']
+            for number in page_obj.paginator.page_range:
+                response = self.client.get(reverse('admin_dashboard'), {**params, 'page': number})
+                seen += [(r.archived, r.pk) for r in response.context['page_obj']]
+        self.assertEqual(len(seen), Attendance.objects.count() + ArchivedAttendance.objects.count())
+        self.assertEqual(len(set(seen)), len(seen))
+
+    def test_dashboard_and_history_read_archived_rows_transparently(self):
+        self.archive()
+        self.client.force_login(User.objects.create_superuser('boss', 'boss@example.com', 'pw'))
+        url = reverse('admin_dashboard')
+        self.assertEqual(self.client.get(url).context['page_obj'].paginator.count, 1)
+        response = self.client.get(url, {'start_date': (self.cutoff - timedelta(days=30)).isoformat()})
+        self.assertEqual(response.context['page_obj'].paginator.count, 3)
+        self.assertContains(response, 'Archived', count=2)
+        response = self.client.get(url, {'end_date': (self.cutoff - timedelta(days=1)).isoformat()})
+        self.assertEqual(response.context['page_obj'].paginator.count, 2)
+
+        self.client.force_login(self.employee)
+        response = self.client.get(reverse('mark_attendance'))
+        # All-time statistics still count the archived absences.
+        self.assertEqual(response.context['absent_days'], 2)
+        self.assertEqual(len(response.context['records']), 1)
+        response = self.client.get(reverse('mark_attendance'), {'history': 'all'})
+        self.assertEqual(len(response.context['records']), 3)
+
+
+class CompressedReportTests(TrackerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.employee = User.objects.create_user('worker', password='pw')
+        self.log = 'deploy step finished without errors\n' * 200
+        self.report = DailyReport.objects.create(
+            employee=self.employee, date=timezone.now().date(), outcomes=self.log, weekly_plan='plan'
+        )
+
+    def test_text_is_stored_compressed_and_decompressed_on_access(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT outcomes FROM tracker_dailyreport WHERE id = %s', [self.report.pk])
+            stored = bytes(cursor.fetchone()[0])
+        self.assertLess(len(stored), len(self.log) / 10)
+
+        report = DailyReport.objects.get(pk=self.report.pk)
+        self.assertIsInstance(report.__dict__['outcomes'], CompressedBytes)
+        self.assertEqual(report.outcomes, self.log)
+        self.assertEqual(report.weekly_plan, 'plan')
+
+    def test_values_and_values_list_return_text(self):
+        reports = DailyReport.objects.filter(pk=self.report.pk)
+        self.assertEqual(reports.values('outcomes', 'weekly_plan')[0], {'outcomes': self.log, 'weekly_plan': 'plan'})
+        self.assertEqual(reports.values_list('outcomes', flat=True)[0], self.log)
+        self.assertEqual(reports.values_list('pk', 'weekly_plan')[0], (self.report.pk, 'plan'))
+        self.assertEqual(reports.values_list('weekly_plan', named=True)[0].weekly_plan, 'plan')
+
+    def test_archiving_copies_text_without_decompressing_it(self):
+        DailyReport.objects.filter(pk=self.report.pk).update(date=archive_cutoff() - timedelta(days=1))
+        with mock.patch.object(CompressedBytes, 'decompress') as decompress:
+            call_command('archive_attendance', stdout=StringIO())
+        decompress.assert_not_called()
+        self.assertEqual(ArchivedDailyReport.objects.get().outcomes, self.log)
+
+    def test_saving_other_fields_keeps_unread_text(self):
+        report = DailyReport.objects.get(pk=self.report.pk)
+        report.weekly_plan = 'new plan'
+        report.save()
+        self.assertIsInstance(report.__dict__['outcomes'], CompressedBytes)
+        report.refresh_from_db()
+        self.assertEqual((report.outcomes, report.weekly_plan), (self.log, 'new plan'))
+
+    def test_dashboard_fetches_report_text_only_when_opened(self):
+        Attendance.objects.create(employee=self.employee, date=self.report.date, status='Present')
+        self.client.force_login(User.objects.create_superuser('boss', 'boss@example.com', 'pw'))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('admin_dashboard'))
+        detail_url = reverse('daily_report_detail', args=[self.report.pk])
+        self.assertContains(response, detail_url)
+        self.assertFalse(any('"outcomes"' in query['sql'] for query in queries))
+
+        response = self.client.get(detail_url)
+        self.assertEqual(response.json()['outcomes'], self.log)
+
+
+@skipUnless(settings.ADMIN_ENABLED, 'Django admin is not installed')
+class AdminChangelistTests(TrackerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(User.objects.create_superuser('boss', 'boss@example.com', 'pw'))
+        self.day = timezone.now().date()
+
+    def add_rows(self, employees, start=0):
+        for i in range(start, start + employees):
+            user = User.objects.create_user(f'worker{i}')
+            Attendance.objects.create(employee=user, date=self.day, status='Present')
+            DailyReport.objects.create(employee=user, date=self.day, outcomes='done ' * 500, weekly_plan='plan')
+
+    def changelist_queries(self, model):
+        url = reverse(f'admin:tracker_{model}_changelist')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return queries
+
+    def test_changelist_query_count_does_not_grow_with_rows(self):
+        self.add_rows(2)
+        before = {model: len(self.changelist_queries(model)) for model in ('attendance', 'dailyreport')}
+        self.add_rows(20, start=2)
+        after = {model: len(self.changelist_queries(model)) for model in ('attendance', 'dailyreport')}
+        self.assertEqual(before, after)
+
+    def test_filtered_changelist_counts_once(self):
+        self.add_rows(3)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('admin:tracker_attendance_changelist'), {'status__exact': 'Present'})
+        counts = [q['sql'] for q in queries if 'COUNT(' in q['sql'] and 'tracker_attendance' in q['sql']]
+        self.assertEqual(len(counts), 1)
+
+    def test_report_changelist_defers_text_columns(self):
+        self.add_rows(3)
+        queries = self.changelist_queries('dailyreport')
+        listing = [q['sql'] for q in queries if 'FROM "tracker_dailyreport"' in q['sql']]
+        self.assertTrue(listing)
+        self.assertFalse(any('"outcomes"' in sql or '"team_metrics"' in sql for sql in listing))
+
+    def test_paginator_uses_estimate_for_unfiltered_tables(self):
+        from .admin import EstimatedCountPaginator
+
+        self.add_rows(3)
+        with mock.patch('tracker.admin.estimated_row_count', return_value=2_000_000):
+            unfiltered = EstimatedCountPaginator(Attendance.objects.order_by('-date'), 100)
+            filtered = EstimatedCountPaginator(Attendance.objects.filter(status='Present').order_by('-date'), 100)
+            self.assertEqual(unfiltered.count, 2_000_000)
+            self.assertEqual(filtered.count, 3)
+        self.assertEqual(EstimatedCountPaginator(Attendance.objects.order_by('-date'), 100).count, 3)
@@ -8,6 +8,8 @@ urlpatterns = [
     path('login/', auth_views.LoginView.as_view(template_name='tracker/login.html'), name='login'),
     path('logout/', auth_views.LogoutView.as_view(next_page='login'), name='logout'),
     path("admin-dashboard/", views.admin_dashboard, name="admin_dashboard"),
+    path("daily-report/<int:report_id>/", views.daily_report_detail, name="daily_report_detail"),
+    path("archived-daily-report/<int:report_id>/", views.daily_report_detail, {"archived": True}, name="archived_daily_report_detail"),
     path("edit-attendance/<int:record_id>/", views.edit_attendance, name="edit_attendance"),
     path("delete-attendance/<int:record_id>/", views.delete_attendance, name="delete_attendance"),
     path("add-employee/", views.add_employee, name="add_employee"),
@@ -1,13 +1,43 @@
 from django.shortcuts import render, redirect, get_object_or_404
-import json
-from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.contrib.auth.decorators import login_required, user_passes_test
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 from django.contrib import messages
-from django.contrib.auth.forms import UserCreationForm
-from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Count, Q
+from django.utils.functional import SimpleLazyObject
 
-from .models import Attendance, DailyReport, GeneratedCredential, EmployeeProfile
+from core.db_routers import read_from_replica
+
+from .archive import archive_cutoff, attendance_records
+from .data_versions import ATTENDANCE, DAILY_REPORTS, EMPLOYEES, attendance_version, table_versions
+from .models import (
+    ArchivedAttendance,
+    ArchivedDailyReport,
+    Attendance,
+    DailyReport,
+    EmployeeProfile,
+    GeneratedCredential,
+)
+
+ATTENDANCE_LOG_PAGE_SIZE = 100
+# Matches the {% cache %} timeouts in the templates.
+FRAGMENT_CACHE_TIMEOUT = 600
+
+
+def _parse_date_param(value):
+    try:
+        return parse_date(value)
+    except ValueError:
+        return None
+
+
+# Same check as django.contrib.admin's staff_member_required, without importing
+# the admin (which lean startups leave out). Redirects to the tracker login.
+staff_member_required = user_passes_test(lambda u: u.is_active and u.is_staff)
 
 
 # =============================
@@ -128,9 +158,9 @@ def mark_attendance(request):
         return redirect("mark_attendance")
 
     # ✅ GET REQUEST
-    records = Attendance.objects.filter(
-        employee=request.user
-    ).order_by("-date")
+    # History before the archive cutoff is only read when asked for.
+    show_archived = request.GET.get("history") == "all"
+    records = attendance_records(include_archive=show_archived, employee=request.user)
 
     # Get today's attendance if already marked
     today_attendance = Attendance.objects.filter(
@@ -138,24 +168,38 @@ def mark_attendance(request):
         date=today
     ).first()
 
-    # Calculate summary statistics
-    all_records = Attendance.objects.filter(employee=request.user)
-    total_hours = sum(record.hours_worked() for record in all_records)
-    absent_days = all_records.filter(status="Absent").count()
-    half_days = all_records.filter(status="Half Day").count()
-    extra_days = all_records.filter(extra_days=True).count()
+    # The history table and the summary statistics only change with the
+    # employee's attendance rows, so both are cached per data version.
+    history_version = attendance_version(employee=request.user)
+
+    def summarize_history():
+        # All-time statistics, archived years included.
+        all_records = attendance_records(include_archive=True, order_by=(), employee=request.user)
+        total_hours = sum(record.hours_worked() for record in all_records)
+        return {
+            "total_hours": round(total_hours, 2),
+            "absent_days": sum(1 for record in all_records if record.status == "Absent"),
+            "half_days": sum(1 for record in all_records if record.status == "Half Day"),
+            "extra_days": sum(1 for record in all_records if record.extra_days),
+        }
+
+    summary = cache.get_or_set(
+        f"attendance-summary:{request.user.pk}:{history_version}",
+        summarize_history,
+        FRAGMENT_CACHE_TIMEOUT,
+    )
 
     user_team = getattr(request.user.profile, 'team', None) if hasattr(request.user, 'profile') else None
 
     return render(request, "tracker/mark_attendance.html", {
         "already_marked": already_marked,
         "records": records,
+        "history_version": history_version,
+        "show_archived": show_archived,
+        "has_archived_history": ArchivedAttendance.objects.filter(employee=request.user).exists(),
         "report": report,
         "today_attendance": today_attendance,
-        "total_hours": round(total_hours, 2),
-        "absent_days": absent_days,
-        "half_days": half_days,
-        "extra_days": extra_days,
+        **summary,
         "user_team": user_team,
     })
 
@@ -203,6 +247,7 @@ def add_employee(request):
 # ✅ ADMIN DASHBOARD
 # =============================
 @staff_member_required
+@read_from_replica
 def admin_dashboard(request):
     # Filter out staff and superusers from employee list
     users = User.objects.filter(is_staff=False, is_superuser=False)
@@ -213,57 +258,88 @@ def admin_dashboard(request):
     end_date = request.GET.get('end_date', '').strip()
 
     # Filter out staff and superusers from logs
-    records_query = Attendance.objects.select_related("employee").filter(
-        employee__is_staff=False, 
-        employee__is_superuser=False
-    ).order_by("-date")
-    
+    filters = {"employee__is_staff": False, "employee__is_superuser": False}
     if employee_filter:
-        records_query = records_query.filter(employee__username__icontains=employee_filter)
-    if start_date:
-        records_query = records_query.filter(date__gte=start_date)
-    if end_date:
-        records_query = records_query.filter(date__lte=end_date)
+        filters["employee__username__icontains"] = employee_filter
+
+    # Ranges reaching back past the archive cutoff also read archived rows.
+    records_query = attendance_records(
+        start_date=_parse_date_param(start_date),
+        end_date=_parse_date_param(end_date),
+        select_related=("employee",),
+        **filters,
+    )
 
-    records = records_query
+    page_obj = Paginator(records_query, ATTENDANCE_LOG_PAGE_SIZE).get_page(request.GET.get('page'))
+
+    # The log and summary tables are fragment-cached in the template. They are
+    # built lazily, so none of their queries run while the cache is warm.
+    def load_records():
+        records = list(page_obj)
+
+        # Fetch corresponding daily reports to display in the view report modal
+        report_dict = {}
+        for report_model, archived in ((DailyReport, False), (ArchivedDailyReport, True)):
+            rows = [r for r in records if r.archived == archived]
+            if rows:
+                # Only the keys: the report text is fetched when the modal opens.
+                reports = report_model.objects.filter(
+                    date__in=[r.date for r in rows], employee__in=[r.employee for r in rows]
+                ).only("employee_id", "date")
+                report_dict.update({(archived, r.employee_id, r.date): r for r in reports})
+
+        for r in records:
+            r.daily_report = report_dict.get((r.archived, r.employee_id, r.date))
+        return records
+
+    def summarize_users():
+        # All-time totals: one grouped query per table instead of five per user.
+        counts = {}
+        for attendance_model in (Attendance, ArchivedAttendance):
+            rows = attendance_model.objects.filter(employee__in=users).values("employee").annotate(
+                total=Count("pk"),
+                present=Count("pk", filter=Q(status="Present")),
+                absent=Count("pk", filter=Q(status="Absent")),
+                half_days=Count("pk", filter=Q(status="Half Day")),
+                extra_days=Count("pk", filter=Q(extra_days=True)),
+            )
+            for row in rows:
+                totals = counts.setdefault(row.pop("employee"), dict.fromkeys(row, 0))
+                for key, value in row.items():
+                    totals[key] += value
+
+        user_summary = []
+
+        for user in users.select_related("profile"):
+            team = getattr(user.profile, 'team', 'Unassigned') if hasattr(user, 'profile') else 'Unassigned'
+            totals = counts.get(user.pk, {})
+
+            user_summary.append({
+                "username": user.username,
+                "team": team,
+                "total": totals.get("total", 0),
+                "present": totals.get("present", 0),
+                "absent": totals.get("absent", 0),
+                "half_days": totals.get("half_days", 0),
+                "extra_days": totals.get("extra_days", 0),
+            })
+        return user_summary
+
+    attendance_data_version, report_data_version, employee_data_version = table_versions(
+        ATTENDANCE, DAILY_REPORTS, EMPLOYEES
+    )
 
-    # Fetch corresponding daily reports to display in the view report modal
-    reports = DailyReport.objects.filter(date__in=[r.date for r in records], employee__in=[r.employee for r in records])
-    report_dict = {(r.employee_id, r.date): r for r in reports}
-    
-    for r in records:
-        report = report_dict.get((r.employee_id, r.date))
-        if report:
-            report.team_metrics_json = json.dumps(report.team_metrics)
-            r.daily_report = report
-        else:
-            r.daily_report = None
-
-    user_summary = []
-
-    for user in users:
-        total = Attendance.objects.filter(employee=user).count()
-        present = Attendance.objects.filter(employee=user, status="Present").count()
-        absent = Attendance.objects.filter(employee=user, status="Absent").count()
-        half_days = Attendance.objects.filter(employee=user, status="Half Day").count()
-        extra_days = Attendance.objects.filter(employee=user, extra_days=True).count()
-        team = getattr(user.profile, 'team', 'Unassigned') if hasattr(user, 'profile') else 'Unassigned'
-
-        user_summary.append({
-            "username": user.username,
-            "team": team,
-            "total": total,
-            "present": present,
-            "absent": absent,
-            "half_days": half_days,
-            "extra_days": extra_days,
-        })
-        
     recent_creds = GeneratedCredential.objects.select_related('user').order_by('-created_at')
 
     return render(request, "tracker/admin_dashboard.html", {
-        "records": records,
-        "user_summary": user_summary,
+        "records": SimpleLazyObject(load_records),
+        "page_obj": page_obj,
+        # The log shows employee names too.
+        "log_version": f"{attendance_data_version}.{report_data_version}.{employee_data_version}",
+        "user_summary": SimpleLazyObject(summarize_users),
+        "summary_version": f"{attendance_data_version}.{employee_data_version}",
+        "employee_count": users.count(),
+        "archive_cutoff": archive_cutoff(),
         "employee_filter": employee_filter,
         "start_date": start_date,
         "end_date": end_date,
@@ -271,6 +347,24 @@ def admin_dashboard(request):
     })
 
 
+# =============================
+# ✅ DAILY REPORT DETAIL (Admin)
+# =============================
+@staff_member_required
+@read_from_replica
+def daily_report_detail(request, report_id, archived=False):
+    report_model = ArchivedDailyReport if archived else DailyReport
+    report = get_object_or_404(report_model, id=report_id)
+    return JsonResponse({
+        "additional_actions": report.additional_actions,
+        "team_metrics": report.team_metrics,
+        "outcomes": report.outcomes,
+        "weekly_plan": report.weekly_plan,
+        "dau_metric": report.dau_metric,
+        "grades_qa": report.grades_qa,
+    })
+
+
 # =============================
 # ✅ EDIT ATTENDANCE (Admin)
 # =============================